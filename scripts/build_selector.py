@@ -67,18 +67,47 @@ cmd /k "`"D:\Develop\Microsoft Visual Studio\VS2022Community\VC\Auxiliary\Build\
 from __future__ import annotations
 
 import argparse
+import atexit
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
 import json
 import logging
 import os
+import re
 import shutil
 import subprocess
 import sys
+import threading
+import time
+import types
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+try:
+    # 可选加速:orjson 解析小文档也比标准库快数倍，缺失时退回 json
+    import orjson
+except ImportError:
+    orjson = None
 
 APP_NAME = "Serial-Studio"
 
+# 脚本所在目录(realpath 解析一次即可，运行期间不会变化)
+_SCRIPT_DIR = Path(__file__).resolve().parent
+
+# msys2/mingw64 的工具目录会让 CMake 进入 MSYS 模式或拿到错误的 link.exe/sh.exe
+# (模块级编译一次，避免每次 configure 重新 import + compile)
+_MSYS_PATH_RE = re.compile(r"(msys2|msys64)[\\/](usr|mingw64)[\\/]bin", re.IGNORECASE)
+
+
+def is_multi_config_generator(generator: Optional[str]) -> bool:
+    """判断生成器是否为多配置(产物位于 <build>/app/<config>/ 子目录)"""
+    if not generator:
+        return False
+    return generator in ("Ninja Multi-Config", "Xcode") or generator.startswith("Visual Studio")
+
 
 class BuildError(RuntimeError):
     """构建过程中发生错误时抛出的异常"""
@@ -105,8 +134,10 @@ class BuildOptions:
     sanitizer: bool = False  # 启用内存检查器(仅 Debug)
     gpl_only: bool = False  # 仅构建 GPL 版本
     clean: bool = False  # 构建前清理目录
+    reconfigure: bool = False  # 强制重新运行 CMake 配置
     run_after_build: bool = False  # 构建后运行应用
     create_package: bool = False  # 构建后创建安装包
+    compiler_cache: bool = True  # 自动接入 ccache/sccache
     info_only: bool = False  # 仅显示配置信息
     verbose: bool = False  # 详细日志输出
 
@@ -121,8 +152,30 @@ class BuildOptions:
     env_overrides: Dict[str, str] = field(default_factory=dict)
 
 
+def default_job_count() -> int:
+    """计算默认并行任务数
+
+    优先级:
+    1. CMAKE_BUILD_PARALLEL_LEVEL 环境变量(CMake 官方约定)
+    2. os.sched_getaffinity - 当前进程实际可用的 CPU(cgroup/容器感知)
+    3. os.cpu_count - 总 CPU 数(Windows 等无 affinity 接口的平台)
+    """
+    env_level = os.environ.get("CMAKE_BUILD_PARALLEL_LEVEL")
+    if env_level:
+        try:
+            return max(1, int(env_level))
+        except ValueError:
+            pass
+    try:
+        # CI/容器中 cpu_count 会报告宿主机全部核心，affinity 才是真实配额
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+@functools.lru_cache(maxsize=None)
 def detect_platform() -> str:
-    """检测当前操作系统平台"""
+    """检测当前操作系统平台(结果缓存，进程内只探测一次)"""
     system = sys.platform
     if system.startswith("darwin"):
         return "mac"
@@ -139,13 +192,41 @@ def configure_logging(verbose: bool) -> logging.Logger:
     return logging.getLogger("serial-studio-build")
 
 
+def _effective_cwd(cwd: Path) -> Optional[Path]:
+    """目标工作目录与当前目录相同时返回 None
+
+    不传 cwd 是 CPython 在 POSIX 上选用 posix_spawn(而非 fork+exec)
+    的前提之一;posix_spawn 无需复制父进程的页表，在解释器堆较大时
+    子进程启动明显更快。从项目根目录运行脚本时即命中此路径。
+    """
+    try:
+        return None if str(cwd) == os.getcwd() else cwd
+    except OSError:
+        return cwd
+
+
 class CommandRunner:
     """命令执行器:封装子进程调用，支持环境变量合并和 dry-run 模式"""
 
-    def __init__(self, logger: logging.Logger, dry_run: bool, env: Dict[str, str]):
+    def __init__(self, logger: logging.Logger, dry_run: bool, env: Optional[Dict[str, str]] = None):
         self._logger = logger
         self._dry_run = dry_run
-        self._base_env = env  # 基础环境变量(从父进程继承)
+        # 基础环境变量;默认直接引用 os.environ，不做整包复制
+        self._base_env = env if env is not None else os.environ
+        # dry-run 且不需要 DEBUG 输出时，run() 可以在任何字符串拼接前返回
+        self._fast_dry = dry_run and not logger.isEnabledFor(logging.DEBUG)
+
+    def _merged_env(self, extra_env: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """合并环境变量
+
+        无覆盖且基础环境就是父进程环境时返回 None，让 subprocess 以
+        零拷贝方式直接继承父进程的 envp。
+        """
+        if extra_env:
+            return {**self._base_env, **extra_env}
+        if self._base_env is os.environ:
+            return None
+        return self._base_env
 
     def run(self, args: Sequence[str], cwd: Path, extra_env: Optional[Dict[str, str]] = None) -> None:
         """
@@ -156,22 +237,76 @@ class CommandRunner:
             cwd: 工作目录
             extra_env: 额外的环境变量(将与基础环境合并)
         """
+        if self._fast_dry:
+            return
         command_str = " ".join(args)
         self._logger.debug("Executing: %s", command_str)
         if self._dry_run:
             return
 
         # 合并环境变量:基础环境 + 额外环境(后者优先)
-        env = {**self._base_env, **(extra_env or {})}
+        env = self._merged_env(extra_env)
+
+        # verbose 模式走流式转发(合并 stderr，便于后续加前缀/截取);
+        # 普通模式让子进程直接继承终端，Python 完全不参与输出路径
+        if self._logger.isEnabledFor(logging.DEBUG):
+            returncode = self._stream(args, cwd=cwd, env=env)
+            if returncode:
+                raise BuildError(f"Command failed ({returncode}): {command_str}")
+            return
         try:
-            subprocess.run(args, cwd=cwd, env=env, check=True)
+            subprocess.run(args, cwd=_effective_cwd(cwd), env=env, check=True)
         except subprocess.CalledProcessError as exc:
             raise BuildError(f"Command failed ({exc.returncode}): {command_str}") from exc
 
+    def _stream(self, args: Sequence[str], cwd: Path, env: Optional[Dict[str, str]]) -> int:
+        """运行命令并以大块读取(64 KiB)转发其输出
+
+        相比按行读取，大块 read 把系统调用次数从每行一次降到每缓冲区
+        一次，编译器刷屏时 Python 不会成为吞吐瓶颈。
+        """
+        # 子进程若是 Python 工具，关闭其块缓冲，避免输出在管道里积压
+        # (仅 verbose 流式路径付这份 env 拷贝的代价)
+        env = {**(env if env is not None else os.environ), "PYTHONUNBUFFERED": "1"}
+        proc = subprocess.Popen(
+            args,
+            cwd=_effective_cwd(cwd),
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0,
+        )
+        assert proc.stdout is not None
+        fd = proc.stdout.fileno()
+        out = sys.stdout.buffer
+        while True:
+            chunk = os.read(fd, 1 << 16)
+            if not chunk:
+                break
+            out.write(chunk)
+            out.flush()
+        return proc.wait()
+
+    def start(self, args: Sequence[str], cwd: Path, extra_env: Optional[Dict[str, str]] = None) -> Optional["subprocess.Popen"]:
+        """非阻塞地启动命令，返回 Popen 供调用方稍后等待(dry-run 返回 None)"""
+        if self._fast_dry:
+            return None
+        self._logger.debug("Executing (background): %s", " ".join(args))
+        if self._dry_run:
+            return None
+        return subprocess.Popen(args, cwd=_effective_cwd(cwd), env=self._merged_env(extra_env))
+
 
 class ToolchainStrategy:
     """工具链策略基类:定义不同平台和编译器的构建行为"""
 
+    # 生成器优先级列表(Ninja 优先:解析构建图更快且默认自动并行)
+    preferred_generators: Sequence[str] = ("Ninja",)
+
+    def resolve_generator(self, options: BuildOptions) -> Optional[str]:
+        """解析本次构建使用的 CMake 生成器(用户指定优先，否则按优先级探测)"""
+        return options.generator or pick_generator(self.preferred_generators)
+
     def configure_args(self, options: BuildOptions) -> List[str]:
         """返回 CMake 配置阶段的参数(如生成器、Qt 路径)"""
         raise NotImplementedError
@@ -185,49 +320,153 @@ class ToolchainStrategy:
         return []
 
 
+def _tool_cache_file() -> Path:
+    """跨进程工具探测缓存的存放位置(遵循 XDG 约定)"""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(str(Path.home()), ".cache")
+    return Path(os.path.join(base, "serial-studio-build", "tools.json"))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_tool_cache() -> Dict[str, str]:
+    """加载上次运行持久化的工具路径(PATH 变化时整体失效)
+
+    缓存按 PATH 的哈希分键:PATH 不变时，上次 which 的结果仍然可信，
+    只需一次 stat 验证文件仍存在;PATH 变了则回落到完整探测。
+    """
+    path_key = hashlib.blake2b(
+        os.environ.get("PATH", "").encode("utf-8", "replace"), digest_size=16
+    ).hexdigest()
+    try:
+        data = json.loads(_tool_cache_file().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        data = {}
+    if data.get("path_hash") != path_key:
+        data = {"path_hash": path_key, "tools": {}}
+    data.setdefault("tools", {})
+    return data
+
+
+def _save_tool_cache() -> None:
+    """原子写回工具缓存(尽力而为，失败不影响构建)"""
+    cache_file = _tool_cache_file()
+    tmp = cache_file.with_suffix(f".tmp-{os.getpid()}")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(_load_tool_cache()) + "\n", encoding="utf-8")
+        os.replace(tmp, cache_file)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+
+
+@functools.lru_cache(maxsize=None)
+def _which_cached(name: str) -> Optional[str]:
+    """shutil.which 的进程内 + 跨进程缓存
+
+    每次 which 都要遍历 PATH(Windows 上还要乘以 PATHEXT 后缀数)，
+    同一个工具在一次构建中会被查找多次，进程内由 lru_cache 兜住;
+    跨进程则复用 tools.json 里的记录，命中时只需一次 stat 验证。
+    只缓存命中结果:工具缺失是罕见路径，重新探测以便安装后立即生效。
+    """
+    cache = _load_tool_cache()
+    cached = cache["tools"].get(name)
+    if cached and os.path.exists(cached):
+        return cached
+    found = shutil.which(name)
+    if found:
+        cache["tools"][name] = found
+        _save_tool_cache()
+    return found
+
+
+@functools.lru_cache(maxsize=None)
 def generator_available(name: str) -> bool:
-    """检查指定的 CMake 生成器是否可用"""
+    """检查指定的 CMake 生成器是否可用(结果缓存)"""
     if name.startswith("Ninja"):
-        return shutil.which("ninja") is not None
+        return _which_cached("ninja") is not None
     if name == "MinGW Makefiles":
-        return shutil.which("mingw32-make") is not None
+        return _which_cached("mingw32-make") is not None
     if name == "NMake Makefiles":
-        return shutil.which("nmake") is not None
+        return _which_cached("nmake") is not None
     if name.startswith("Visual Studio"):
         # 检查是否在 MSVC 环境中(通过检查 VCINSTALLDIR 环境变量)
         # 或者 vswhere 是否可用(用于检测 Visual Studio 安装)
-        return os.environ.get("VCINSTALLDIR") is not None or shutil.which("vswhere") is not None
+        return os.environ.get("VCINSTALLDIR") is not None or _which_cached("vswhere") is not None
     return True
 
 
 def pick_generator(preferred: Iterable[str]) -> Optional[str]:
-    """从首选列表中选择第一个可用的生成器"""
-    for candidate in preferred:
-        if generator_available(candidate):
-            return candidate
-    return None
+    """从首选列表中选择第一个可用的生成器
+
+    generator_available 带 lru_cache，首次调用完成全部工具探测后，
+    后续选择只是字典查找。
+    """
+    return next((candidate for candidate in preferred if generator_available(candidate)), None)
+
+
+# 目录扫描结果缓存:同一路径在一个进程内只读一次目录
+_DIR_NAMES_CACHE: Dict[str, frozenset] = {}
+
+
+def _scan_dir_names(path: Path) -> frozenset:
+    """读取目录的条目名集合(缓存;一次 scandir 替代逐项 stat 探测)"""
+    key = str(path)
+    names = _DIR_NAMES_CACHE.get(key)
+    if names is None:
+        with os.scandir(path) as entries:
+            names = frozenset(entry.name for entry in entries)
+        _DIR_NAMES_CACHE[key] = names
+    return names
+
+
+def _validate_qt_root(path: Path, label: str, check_layout: bool) -> None:
+    """验证单个 Qt 目录(存在、是目录、可选检查典型 Qt 结构)"""
+    try:
+        names = _scan_dir_names(path)
+    except FileNotFoundError as exc:
+        raise BuildError(f"{label} does not exist: {path}") from exc
+    except NotADirectoryError as exc:
+        raise BuildError(f"{label} is not a directory: {path}") from exc
+    if check_layout and "bin" not in names and "lib" not in names:
+        raise BuildError(f"{label} does not appear to be a valid Qt installation: {path}")
 
 
 def validate_qt_paths(qt_root: Optional[Path], qt_tools_root: Optional[Path]) -> None:
-    """验证 Qt 路径是否存在且有效"""
-    if qt_root:
-        if not qt_root.exists():
-            raise BuildError(f"Qt root path does not exist: {qt_root}")
-        if not qt_root.is_dir():
-            raise BuildError(f"Qt root path is not a directory: {qt_root}")
-        # 检查是否包含典型的 Qt 目录结构
-        if not (qt_root / "bin").exists() and not (qt_root / "lib").exists():
-            raise BuildError(f"Qt root path does not appear to be a valid Qt installation: {qt_root}")
+    """验证 Qt 路径是否存在且有效
 
+    两个目录互相独立;同时给出时并行探测(网络盘上 stat 延迟可叠加
+    等待)，并把所有错误合并成一条消息，让用户一次改完。
+    """
+    tasks = []
+    if qt_root:
+        tasks.append((qt_root, "Qt root path", True))
     if qt_tools_root:
-        if not qt_tools_root.exists():
-            raise BuildError(f"Qt tools root path does not exist: {qt_tools_root}")
-        if not qt_tools_root.is_dir():
-            raise BuildError(f"Qt tools root path is not a directory: {qt_tools_root}")
+        tasks.append((qt_tools_root, "Qt tools root path", False))
+    if not tasks:
+        return
+    if len(tasks) == 1:
+        path, label, check_layout = tasks[0]
+        _validate_qt_root(path, label, check_layout=check_layout)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        futures = [
+            pool.submit(_validate_qt_root, path, label, check_layout=check_layout)
+            for path, label, check_layout in tasks
+        ]
+    errors: List[str] = []
+    for future in futures:
+        try:
+            future.result()
+        except BuildError as exc:
+            errors.append(str(exc))
+    if errors:
+        raise BuildError("\n".join(errors))
 
 
+@functools.lru_cache(maxsize=None)
 def check_msvc_environment() -> bool:
-    """检查是否在正确的 MSVC 环境中运行"""
+    """检查是否在正确的 MSVC 环境中运行(结果缓存)"""
     # MSVC 环境会设置这些环境变量
     msvc_vars = ["VCINSTALLDIR", "VSINSTALLDIR", "VCToolsInstallDir"]
     return any(os.environ.get(var) for var in msvc_vars)
@@ -236,9 +475,12 @@ def check_msvc_environment() -> bool:
 class GenericToolchain(ToolchainStrategy):
     """通用工具链策略(用于 macOS 和 Linux)"""
 
+    # 优先选择 Ninja Multi-Config(Debug/Release 共享一棵构建树，切换
+    # 构建类型无需重新配置)，其次普通 Ninja，最后 Unix Makefiles
+    preferred_generators = ("Ninja Multi-Config", "Ninja", "Unix Makefiles")
+
     def configure_args(self, options: BuildOptions) -> List[str]:
-        # 优先选择 Ninja，否则使用 Unix Makefiles
-        generator = options.generator or pick_generator(["Ninja", "Unix Makefiles"])
+        generator = self.resolve_generator(options)
         args: List[str] = []
         if generator:
             args.extend(["-G", generator])
@@ -251,9 +493,12 @@ class GenericToolchain(ToolchainStrategy):
 class MinGWToolchain(ToolchainStrategy):
     """MinGW 工具链策略(Windows 上的 GCC)"""
 
+    # MinGW 优先使用 Ninja Multi-Config/Ninja(支持 MinGW 的 gcc.exe)，
+    # 否则使用 MinGW Makefiles
+    preferred_generators = ("Ninja Multi-Config", "Ninja", "MinGW Makefiles")
+
     def configure_args(self, options: BuildOptions) -> List[str]:
-        # MinGW 优先使用 Ninja，否则使用 MinGW Makefiles
-        generator = options.generator or pick_generator(["Ninja", "MinGW Makefiles"])
+        generator = self.resolve_generator(options)
         if not generator:
             raise BuildError("No suitable CMake generator found for MinGW (install Ninja or mingw32-make).")
         args = ["-G", generator]
@@ -273,11 +518,12 @@ class MinGWToolchain(ToolchainStrategy):
         """
         extra_path: List[str] = []
         # 编译器路径应该有最高优先级，避免使用系统PATH中的其他版本
+        # os.path.join 直接拼字符串，省去 Path 对象的构造与再转换
         if options.qt_tools_root:
-            extra_path.append(str(options.qt_tools_root / "bin"))
+            extra_path.append(os.path.join(str(options.qt_tools_root), "bin"))
         # Qt DLL 路径次之
         if options.qt_root:
-            extra_path.append(str(options.qt_root / "bin"))
+            extra_path.append(os.path.join(str(options.qt_root), "bin"))
         if not extra_path:
             return {}
         # 使用 os.pathsep 确保跨平台兼容(Windows 用 ;，Unix 用 :)
@@ -288,6 +534,9 @@ class MinGWToolchain(ToolchainStrategy):
 class MsvcToolchain(ToolchainStrategy):
     """MSVC 工具链策略(Visual Studio 编译器)"""
 
+    # MSVC 优先使用 Ninja Multi-Config/Ninja，否则使用 NMake Makefiles
+    preferred_generators = ("Ninja Multi-Config", "Ninja", "NMake Makefiles")
+
     def configure_args(self, options: BuildOptions) -> List[str]:
         # 检查是否在正确的 MSVC 环境中
         if not check_msvc_environment():
@@ -298,9 +547,7 @@ class MsvcToolchain(ToolchainStrategy):
                 "  - Or execute 'vcvarsall.bat' before running this script"
             )
 
-        # MSVC 优先使用 Ninja，否则使用 NMake Makefiles
-        preferred = ["Ninja", "Ninja Multi-Config", "NMake Makefiles"]
-        generator = options.generator or pick_generator(preferred)
+        generator = self.resolve_generator(options)
         if not generator:
             raise BuildError("No suitable generator found for MSVC (install Ninja or use Developer Command Prompt for nmake).")
         args = ["-G", generator]
@@ -324,17 +571,15 @@ class MsvcToolchain(ToolchainStrategy):
 
         # 过滤 PATH 中的 msys2/mingw64/git 的 usr/bin，避免 CMake 进入 MSYS 模式或拿到错误的 link.exe/sh.exe
         try:
-            import re as _re
             # 过滤 msys2/mingw64 的路径，但保留 msys2 中的独立工具(如 ninja)
             # 主要过滤 /usr/bin 和 /mingw64/bin，因为这些会导致工具链冲突
-            bad = _re.compile(r"(msys2|msys64)[\\/](usr|mingw64)[\\/]bin", _re.IGNORECASE)
             parts = os.environ.get("PATH", "").split(os.pathsep)
-            filtered = [p for p in parts if not bad.search(p or "")]
+            filtered = [p for p in parts if not _MSYS_PATH_RE.search(p or "")]
 
             # 将 Qt 路径添加到前端，确保优先使用 Qt 的 DLL 和工具
             qt_paths: List[str] = []
             if options.qt_root:
-                qt_paths.append(str(options.qt_root / "bin"))
+                qt_paths.append(os.path.join(str(options.qt_root), "bin"))
 
             if qt_paths or filtered:
                 env["PATH"] = os.pathsep.join(qt_paths + filtered)
@@ -351,21 +596,32 @@ class MsvcToolchain(ToolchainStrategy):
         return ["--config", options.build_type]
 
 
-def load_config_file(path: Optional[str]) -> Dict[str, str]:
+@functools.lru_cache(maxsize=None)
+def _parse_config_file(path_str: str, mtime_ns: int) -> Dict[str, str]:
+    """解析 JSON 配置文件(按路径+mtime 缓存，重复调用不再重新解析)"""
+    raw = Path(path_str).read_bytes()
+    try:
+        # json/orjson 均可直接消费 bytes，省去文本解码层
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except ValueError as exc:
+        raise BuildError(f"Invalid JSON config: {path_str}") from exc
+    if not isinstance(data, dict):
+        raise BuildError("Config file must contain a JSON object.")
+    return data
+
+
+# 未指定配置文件时的共享只读空配置:省一次 dict 分配，且防止被误改
+_EMPTY_CONFIG: Mapping[str, str] = types.MappingProxyType({})
+
+
+def load_config_file(path: Optional[str]) -> Mapping[str, str]:
     """从 JSON 文件加载配置项"""
     if not path:
-        return {}
+        return _EMPTY_CONFIG
     config_path = Path(path).expanduser()
     if not config_path.exists():
         raise BuildError(f"Config file not found: {config_path}")
-    with config_path.open("r", encoding="utf-8") as handle:
-        try:
-            data = json.load(handle)
-        except json.JSONDecodeError as exc:
-            raise BuildError(f"Invalid JSON config: {config_path}") from exc
-    if not isinstance(data, dict):
-        raise BuildError("Config file must contain a JSON object.")
-    return {str(k): v for k, v in data.items()}
+    return _parse_config_file(str(config_path), config_path.stat().st_mtime_ns)
 
 
 def parse_env_overrides(values: Sequence[str]) -> Dict[str, str]:
@@ -388,7 +644,7 @@ def resolve_command(preferred: Optional[str], fallback: str, *, require_explicit
         raise BuildError(
             f"Explicit path required for '{fallback}'. Provide it via {option_hint} or JSON config when targeting Windows."
         )
-    found = shutil.which(fallback)
+    found = _which_cached(fallback)
     if not found:
         raise BuildError(f"Required command '{fallback}' not found in PATH; specify it explicitly with CLI options.")
     return found
@@ -399,11 +655,29 @@ def determine_build_directory(options: BuildOptions, project_root: Path) -> Path
     if options.build_dir.is_absolute():
         return options.build_dir
     # 构建目录结构:build/<platform>/<toolchain>/<build_type>
+    # 多配置生成器的 Debug/Release 产物共存于同一棵树("multi")，
+    # 切换构建类型只换 --config，不触发重新配置
     segments: List[str] = ["build", options.platform]
     if options.toolchain:
         segments.append(options.toolchain)
-    segments.append(options.build_type.lower())
-    return project_root / Path(*segments)
+    if is_multi_config_generator(options.generator):
+        segments.append("multi")
+    else:
+        segments.append(options.build_type.lower())
+    # 用 os.path.join 一次拼出完整路径，再包一层 Path，比逐级 / 运算便宜
+    return Path(os.path.join(str(project_root), *segments))
+
+
+@functools.lru_cache(maxsize=None)
+def find_project_root(cwd: Path) -> Path:
+    """定位项目根目录(含 CMakeLists.txt 的第一个候选，结果缓存)
+
+    候选顺序:当前目录 → 脚本目录 → 脚本父目录;全部落空时退回当前目录。
+    """
+    for candidate in (cwd, _SCRIPT_DIR, _SCRIPT_DIR.parent):
+        if (candidate / "CMakeLists.txt").exists():
+            return candidate
+    return cwd
 
 
 def select_toolchain(options: BuildOptions) -> ToolchainStrategy:
@@ -421,6 +695,32 @@ def select_toolchain(options: BuildOptions) -> ToolchainStrategy:
     return GenericToolchain()
 
 
+def log_build_info(options: BuildOptions, build_dir: Path, logger: logging.Logger) -> None:
+    """输出构建配置摘要(--info 快速路径，无需构造 Builder/工具链)"""
+    logger.info("Build configuration:")
+    logger.info("  platform      : %s", options.platform)
+    logger.info("  build type    : %s", options.build_type)
+    if options.toolchain:
+        logger.info("  toolchain     : %s", options.toolchain)
+    logger.info("  build dir     : %s", build_dir)
+    if options.generator:
+        logger.info("  generator     : %s", options.generator)
+    if options.jobs:
+        logger.info("  parallel jobs : %s", options.jobs)
+    if options.qt_cmake_binary:
+        logger.info("  qt-cmake      : %s", options.qt_cmake_binary)
+    if options.cmake_binary:
+        logger.info("  cmake         : %s", options.cmake_binary)
+    if options.qt_root:
+        logger.info("  Qt root       : %s", options.qt_root)
+    if options.qt_tools_root:
+        logger.info("  Qt tools root : %s", options.qt_tools_root)
+    if options.extra_cmake_args:
+        logger.info("  extra args    : %s", " ".join(options.extra_cmake_args))
+    if options.env_overrides:
+        logger.info("  env overrides : %s", options.env_overrides)
+
+
 class Builder:
     """构建器类:封装完整的 CMake 构建流程"""
 
@@ -438,129 +738,341 @@ class Builder:
         self.runner = runner
         self.toolchain = toolchain
         self.build_dir = determine_build_directory(options, project_root)
+        self._generator: Optional[str] = None
+        self._clean_thread: Optional[threading.Thread] = None
+        # 以下为惰性缓存:各构建阶段共用，避免重复解析/重建
+        self._cmake_bin: Optional[str] = None
+        self._configure_bin: Optional[str] = None
+        self._toolchain_env: Optional[Dict[str, str]] = None
+
+    @property
+    def generator(self) -> Optional[str]:
+        """本次构建实际使用的 CMake 生成器(首次访问时解析并缓存)"""
+        if self._generator is None:
+            self._generator = self.toolchain.resolve_generator(self.options)
+        return self._generator
+
+    def _compiler_cache_launcher(self) -> Optional[str]:
+        """探测可用的编译器缓存(sccache 优先;ccache 不支持 MSVC 的 cl.exe)"""
+        sccache = _which_cached("sccache")
+        if sccache:
+            return sccache
+        if self.options.toolchain == "msvc":
+            return None
+        return _which_cached("ccache")
+
+    def _resolve_cmake(self) -> str:
+        """解析 cmake 可执行文件(缓存，configure/build/package 共用)"""
+        if self._cmake_bin is None:
+            self._cmake_bin = resolve_command(
+                self.options.cmake_binary,
+                "cmake",
+                require_explicit=self.options.platform == "windows",
+            )
+        return self._cmake_bin
+
+    def _toolchain_environment(self) -> Dict[str, str]:
+        """工具链附加环境变量(缓存，避免每阶段重新过滤 PATH)"""
+        if self._toolchain_env is None:
+            self._toolchain_env = self.toolchain.configure_env(self.options)
+        return self._toolchain_env
 
     def _configure_executable(self) -> str:
+        if self._configure_bin is not None:
+            return self._configure_bin
         if self.options.qt_cmake_binary:
-            return self.options.qt_cmake_binary
-        if self.options.platform != "windows":
-            try:
-                return resolve_command(None, "qt-cmake")
-            except BuildError:
-                pass
-        return resolve_command(
-            self.options.cmake_binary,
-            "cmake",
-            require_explicit=self.options.platform == "windows",
-        )
+            self._configure_bin = self.options.qt_cmake_binary
+        else:
+            if self.options.platform != "windows":
+                try:
+                    self._configure_bin = resolve_command(None, "qt-cmake")
+                except BuildError:
+                    self._configure_bin = None
+            if self._configure_bin is None:
+                self._configure_bin = self._resolve_cmake()
+        return self._configure_bin
 
     def info(self) -> None:
-        self.logger.info("Build configuration:")
-        self.logger.info("  platform      : %s", self.options.platform)
-        self.logger.info("  build type    : %s", self.options.build_type)
-        if self.options.toolchain:
-            self.logger.info("  toolchain     : %s", self.options.toolchain)
-        self.logger.info("  build dir     : %s", self.build_dir)
-        if self.options.generator:
-            self.logger.info("  generator     : %s", self.options.generator)
-        if self.options.jobs:
-            self.logger.info("  parallel jobs : %s", self.options.jobs)
-        if self.options.qt_cmake_binary:
-            self.logger.info("  qt-cmake      : %s", self.options.qt_cmake_binary)
-        if self.options.cmake_binary:
-            self.logger.info("  cmake         : %s", self.options.cmake_binary)
-        if self.options.qt_root:
-            self.logger.info("  Qt root       : %s", self.options.qt_root)
-        if self.options.qt_tools_root:
-            self.logger.info("  Qt tools root : %s", self.options.qt_tools_root)
-        if self.options.extra_cmake_args:
-            self.logger.info("  extra args    : %s", " ".join(self.options.extra_cmake_args))
-        if self.options.env_overrides:
-            self.logger.info("  env overrides : %s", self.options.env_overrides)
+        log_build_info(self.options, self.build_dir, self.logger)
 
     def clean(self) -> None:
+        """清理构建目录
+
+        先将目录原子地改名为垃圾目录(一次 rename 系统调用)，再由后台线程
+        执行真正的删除，这样 configure 无需等待大量 unlink 完成即可开始。
+        进程退出前通过 atexit 等待删除线程结束。
+        """
         if not self.build_dir.exists():
             return
         self.logger.info("Removing build directory: %s", self.build_dir)
-        shutil.rmtree(self.build_dir)
+        if self.options.dry_run:
+            return
+        # pid+时间戳后缀:避免与上次异常退出残留的垃圾目录重名
+        trash = self.build_dir.with_name(f"{self.build_dir.name}.trash-{os.getpid()}-{time.monotonic_ns()}")
+        try:
+            self.build_dir.rename(trash)
+        except OSError:
+            # 改名失败(目标已存在、跨文件系统等)时退回同步删除
+            shutil.rmtree(self.build_dir, ignore_errors=True)
+            return
+        worker = threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True})
+        worker.start()
+        atexit.register(worker.join)
+        self._clean_thread = worker
+
+    def _toolchain_check_cache(self) -> Path:
+        """工具链探测结果的 CMake 初始缓存文件路径"""
+        return self.build_dir / "toolchain-check-cache.cmake"
+
+    def _write_toolchain_check_cache(self) -> None:
+        """配置成功后，把编译器特性探测结果固化为 -C 初始缓存
+
+        CMakeCache.txt 中的 HAVE_* / CMAKE_HAVE_* 条目来自昂贵的
+        try_compile 探测;转存为初始缓存文件后，下一次全新配置可以
+        通过 -C 直接复用，省去重复的编译器调用。
+        """
+        target = self._toolchain_check_cache()
+        if target.exists():
+            return
+        cache = self.build_dir / "CMakeCache.txt"
+        try:
+            lines = cache.read_text(encoding="utf-8", errors="ignore").splitlines()
+        except OSError:
+            return
+        entries: List[str] = []
+        for line in lines:
+            if not line or line.startswith(("#", "//")):
+                continue
+            name_type, sep, value = line.partition("=")
+            if not sep:
+                continue
+            name, sep, cache_type = name_type.partition(":")
+            if not sep:
+                continue
+            if name.startswith(("HAVE_", "CMAKE_HAVE_", "__check_")):
+                entries.append(f'set({name} "{value}" CACHE {cache_type} "cached toolchain check")')
+        if entries:
+            target.write_text("\n".join(entries) + "\n", encoding="utf-8")
+
+    @property
+    def _fingerprint_file(self) -> Path:
+        return self.build_dir / ".build_selector_fingerprint"
+
+    @property
+    def _state_file(self) -> Path:
+        return self.build_dir / ".build_selector_state.json"
+
+    @property
+    def _cmake_inputs_file(self) -> Path:
+        return self.build_dir / ".cmake_inputs.json"
+
+    def _scan_cmake_inputs(self) -> Dict[str, int]:
+        """收集源码树中全部 CMake 列表文件的修改时间
+
+        配置阶段的跳过判断依赖这份清单:任何 CMakeLists.txt 或 *.cmake
+        变动(含新增/删除)都会使其与上次记录不一致，从而触发重新配置。
+        .git 与构建输出目录在遍历时剪枝，整棵树只有百余个目录，扫描
+        开销远低于一次多余的 CMake 配置。
+        """
+        inputs: Dict[str, int] = {}
+        root = str(self.project_root)
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [
+                d for d in dirnames
+                if d != ".git" and not d.startswith("build")
+            ]
+            for name in filenames:
+                if name == "CMakeLists.txt" or name.endswith(".cmake"):
+                    full = os.path.join(dirpath, name)
+                    try:
+                        inputs[os.path.relpath(full, root)] = os.stat(full).st_mtime_ns
+                    except OSError:
+                        continue
+        return inputs
+
+    def _cmake_inputs_up_to_date(self) -> bool:
+        try:
+            stored = json.loads(self._cmake_inputs_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        return stored == self._scan_cmake_inputs()
+
+    def _stored_generator(self) -> Optional[str]:
+        """读取上次 configure 记录的生成器(无记录时退回重新探测)"""
+        try:
+            state = json.loads(self._state_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return self.generator
+        return state.get("generator") or self.generator
+
+    def _configure_fingerprint(self) -> str:
+        """计算影响 CMake 配置结果的全部输入的指纹
+
+        指纹覆盖构建类型、工具链、生成器、Qt 路径、额外 CMake 参数等
+        选项，以及顶层 CMakeLists.txt 的修改时间;任一输入变化都会
+        导致指纹不同，从而触发重新配置。多配置生成器的构建类型在
+        构建阶段用 --config 选择，不参与指纹，Debug/Release 互切
+        不会触发共享树的重新配置。
+        """
+        top_lists = self.project_root / "CMakeLists.txt"
+        try:
+            lists_mtime = top_lists.stat().st_mtime_ns
+        except OSError:
+            lists_mtime = 0
+        multi_config = is_multi_config_generator(self.generator)
+        payload = json.dumps(
+            {
+                "build_type": None if multi_config else self.options.build_type,
+                "toolchain": self.options.toolchain,
+                "generator": self.options.generator,
+                "qt_root": str(self.options.qt_root) if self.options.qt_root else None,
+                "qt_tools_root": str(self.options.qt_tools_root) if self.options.qt_tools_root else None,
+                "extra_cmake_args": self.options.extra_cmake_args,
+                "gpl_only": self.options.gpl_only,
+                "production": self.options.production,
+                "sanitizer": self.options.sanitizer,
+                "compiler_cache": self.options.compiler_cache,
+                "cmakelists_mtime_ns": lists_mtime,
+            },
+            sort_keys=True,
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _configure_up_to_date(self) -> bool:
+        """判断能否跳过 CMake 配置(已有缓存且配置输入指纹未变化)"""
+        if self.options.reconfigure or self.options.clean:
+            return False
+        if not (self.build_dir / "CMakeCache.txt").exists():
+            return False
+        try:
+            stored = self._fingerprint_file.read_text(encoding="utf-8").strip()
+        except OSError:
+            return False
+        if stored != self._configure_fingerprint():
+            return False
+        # 选项未变还不够:子目录里的 CMake 列表文件变了同样要重新配置
+        return self._cmake_inputs_up_to_date()
 
     def configure(self) -> None:
-        """执行 CMake 配置步骤"""
+        """执行 CMake 配置步骤(缓存有效时直接跳过)"""
+        if self._configure_up_to_date():
+            self.logger.info("CMake cache up-to-date, skipping configure (use --reconfigure to force).")
+            return
         self.logger.info("Configuring project...")
-        self.build_dir.mkdir(parents=True, exist_ok=True)
+        # dry-run 不落盘(包括创建构建目录)
+        if not self.options.dry_run:
+            self.build_dir.mkdir(parents=True, exist_ok=True)
 
         cmake_bin = self._configure_executable()
+        check_cache = self._toolchain_check_cache()
+        toolchain_args = self.toolchain.configure_args(self.options)
+        # 多配置生成器不消费 CMAKE_BUILD_TYPE(构建阶段用 --config 选择)，
+        # 不传它才能保证 Debug/Release 互切不扰动缓存、不触发重新配置
+        multi_config = is_multi_config_generator(self.generator)
+
+        # 自动接入编译器缓存，未变更的翻译单元在重编译时直接命中缓存
+        launcher = self._compiler_cache_launcher() if self.options.compiler_cache else None
+        if launcher:
+            self.logger.info("Using compiler cache: %s", launcher)
 
-        # 构造 CMake 配置命令
+        # 如使用 Ninja，显式指定 Ninja 可执行文件，避免 PATH 冲突
+        ninja_bin = None
+        if "-G" in toolchain_args:
+            generator = toolchain_args[toolchain_args.index("-G") + 1]
+            if generator.startswith("Ninja"):
+                ninja_bin = _which_cached("ninja")
+
+        # 一次列表字面量构造完整命令，条件段用解包拼入(单次分配，免去
+        # 逐项 append/extend 的反复扩容)
         configure_cmd = [
             cmake_bin,
-            "-S",  # 源代码目录
-            str(self.project_root),
-            "-B",  # 构建输出目录
-            str(self.build_dir),
-            f"-DCMAKE_BUILD_TYPE={self.options.build_type}",
+            "-S", str(self.project_root),  # 源代码目录
+            "-B", str(self.build_dir),  # 构建输出目录
+            *([] if multi_config else [f"-DCMAKE_BUILD_TYPE={self.options.build_type}"]),
             f"-DBUILD_GPL3={'ON' if self.options.gpl_only else 'OFF'}",
+            # CPack 压缩(zstd/xz)按核心数自动并行
+            "-DCPACK_THREADS=0",
+            # 复用上次固化的工具链探测结果，跳过重复的 try_compile
+            *(["-C", str(check_cache)] if check_cache.exists() else []),
+            # 项目特定的构建选项
+            *(["-DPRODUCTION_OPTIMIZATION=ON"] if self.options.production else []),
+            *(["-DDEBUG_SANITIZER=ON"] if self.options.sanitizer else []),
+            # 工具链特定的配置参数(生成器、Qt 路径等)
+            *toolchain_args,
+            *(
+                [
+                    f"-DCMAKE_C_COMPILER_LAUNCHER={launcher}",
+                    f"-DCMAKE_CXX_COMPILER_LAUNCHER={launcher}",
+                ]
+                if launcher
+                else []
+            ),
+            *([f"-DCMAKE_MAKE_PROGRAM={ninja_bin}"] if ninja_bin else []),
+            # 用户指定的额外 CMake 参数
+            *self.options.extra_cmake_args,
         ]
 
-        # 添加项目特定的构建选项
-        if self.options.production:
-            configure_cmd.append("-DPRODUCTION_OPTIMIZATION=ON")
-        if self.options.sanitizer:
-            configure_cmd.append("-DDEBUG_SANITIZER=ON")
-
-        # 添加工具链特定的配置参数(生成器、Qt 路径等)
-        configure_cmd.extend(self.toolchain.configure_args(self.options))
-
-        # 如使用 Ninja，显式指定 Ninja 可执行文件，避免 PATH 冲突
-        try:
-            if "-G" in configure_cmd:
-                _idx = configure_cmd.index("-G")
-                _gen = configure_cmd[_idx+1]
-                if _gen.startswith("Ninja"):
-                    _ninja = shutil.which("ninja")
-                    if _ninja:
-                        configure_cmd.append(f"-DCMAKE_MAKE_PROGRAM={_ninja}")
-        except Exception:
-            pass
-
-        # 添加用户指定的额外 CMake 参数
-        configure_cmd.extend(self.options.extra_cmake_args)
-
-        # 合并环境变量:用户覆盖 + 工具链特定环境
+        # 合并环境变量:用户覆盖 + 工具链特定环境(后者已缓存)
         env = self.options.env_overrides.copy()
-        env.update(self.toolchain.configure_env(self.options))
+        env.update(self._toolchain_environment())
 
         self.runner.run(configure_cmd, cwd=self.project_root, extra_env=env)
 
-    def build(self) -> None:
-        """执行 CMake 构建步骤"""
+        # 固化本次探测结果与配置指纹，供后续运行复用/跳过
+        if not self.options.dry_run:
+            self._write_toolchain_check_cache()
+            self._fingerprint_file.write_text(self._configure_fingerprint() + "\n", encoding="utf-8")
+            self._cmake_inputs_file.write_text(
+                json.dumps(self._scan_cmake_inputs()) + "\n", encoding="utf-8"
+            )
+            self._state_file.write_text(
+                json.dumps({"generator": self.generator}) + "\n", encoding="utf-8"
+            )
+
+    def build(self, with_package: bool = False) -> None:
+        """执行 CMake 构建步骤
+
+        参数:
+            with_package: 同时构建 package 目标(与默认目标合并为一次
+                cmake 调用，省去一次进程启动)
+        """
         self.logger.info("Building project...")
-        cmake_bin = resolve_command(
-            self.options.cmake_binary,
-            "cmake",
-            require_explicit=self.options.platform == "windows",
-        )
+        cmake_bin = self._resolve_cmake()
         build_cmd = [
             cmake_bin,
             "--build",
             str(self.build_dir),
         ]
+        if with_package:
+            build_cmd.extend(["--target", "all", "--target", "package"])
 
         # 启用并行构建以加速编译
-        if self.options.jobs and self.options.jobs > 1:
+        # Ninja 默认按 CPU 数自动并行，无需 --parallel;Make/MSBuild 仍需显式指定
+        is_ninja = bool(self.generator and self.generator.startswith("Ninja"))
+        if not is_ninja and self.options.jobs:
             build_cmd.extend(["--parallel", str(self.options.jobs)])
 
         # 添加工具链特定的构建参数(如 MSVC 的 --config)
         build_cmd.extend(self.toolchain.build_args(self.options))
-        self.runner.run(build_cmd, cwd=self.project_root, extra_env=self.options.env_overrides)
+        # 多配置生成器必须显式指定构建的配置
+        if "--config" not in build_cmd and is_multi_config_generator(self.generator):
+            build_cmd.extend(["--config", self.options.build_type])
+        self.runner.run(build_cmd, cwd=self.project_root, extra_env=self._subprocess_env())
 
-    def package(self) -> None:
-        """执行 CMake 打包步骤(创建安装包)"""
-        self.logger.info("Creating package...")
-        cmake_bin = resolve_command(
-            self.options.cmake_binary,
-            "cmake",
-            require_explicit=self.options.platform == "windows",
-        )
+    def _subprocess_env(self) -> Dict[str, str]:
+        """构建/打包子进程的额外环境变量
+
+        统一通过 CMAKE_BUILD_PARALLEL_LEVEL 传递并行度，Ninja、Make、
+        MSBuild 等原生构建工具都会识别该约定。
+        """
+        env = dict(self.options.env_overrides)
+        if self.options.jobs:
+            env.setdefault("CMAKE_BUILD_PARALLEL_LEVEL", str(self.options.jobs))
+        return env
+
+    def _package_cmd(self) -> List[str]:
+        """构造打包命令(调用 CPack 的 package 目标)"""
+        cmake_bin = self._resolve_cmake()
         package_cmd = [
             cmake_bin,
             "--build",
@@ -568,47 +1080,79 @@ class Builder:
             "--target",
             "package",  # 调用 CPack 生成安装包
         ]
+        # 多组件打包(压缩)同样吃多核
+        if self.options.jobs and self.options.jobs > 1:
+            package_cmd.extend(["--parallel", str(self.options.jobs)])
         package_cmd.extend(self.toolchain.build_args(self.options))
-        self.runner.run(package_cmd, cwd=self.project_root, extra_env=self.options.env_overrides)
+        if "--config" not in package_cmd and is_multi_config_generator(self.generator):
+            package_cmd.extend(["--config", self.options.build_type])
+        return package_cmd
+
+    def package(self) -> None:
+        """执行 CMake 打包步骤(创建安装包)"""
+        self.logger.info("Creating package...")
+        self.runner.run(self._package_cmd(), cwd=self.project_root, extra_env=self._subprocess_env())
+
+    def package_async(self) -> Optional["subprocess.Popen"]:
+        """在后台启动打包步骤，调用方负责 wait() 并检查返回码"""
+        self.logger.info("Creating package (in background)...")
+        return self.runner.start(self._package_cmd(), cwd=self.project_root, extra_env=self._subprocess_env())
+
+    @staticmethod
+    def _output_dir_names(directory: Path) -> frozenset:
+        """读取构建输出目录的条目名(一次 scandir 替代逐候选 stat)"""
+        try:
+            return _scan_dir_names(directory)
+        except OSError:
+            return frozenset()
 
-    def run_app(self) -> None:
-        """构建完成后启动应用程序"""
+    def run_app(self, allow_exec: bool = True) -> None:
+        """构建完成后启动应用程序
+
+        参数:
+            allow_exec: 允许用 exec 替换当前进程(有后台任务待等待时应传 False)
+        """
         self.logger.info("Launching application...")
-        app_path: Path
+
+        # 多配置生成器的产物在 app/<config>/ 子目录;生成器信息在
+        # configure 时已记录，无需回读整个 CMakeCache.txt
+        output_dir = self.build_dir / "app"
+        if is_multi_config_generator(self._stored_generator()):
+            output_dir = output_dir / self.options.build_type
 
         # macOS:应用程序打包为 .app bundle
         if self.options.platform == "mac":
-            app_dir = self.build_dir / "app" / f"{APP_NAME}.app"
-            if not app_dir.exists():
+            app_dir = output_dir / f"{APP_NAME}.app"
+            if app_dir.name not in self._output_dir_names(output_dir):
                 raise BuildError(f"Application bundle not found: {app_dir}")
             self.runner.run(["open", str(app_dir)], cwd=self.project_root, extra_env=self.options.env_overrides)
             return
 
         # Windows 和 Linux:直接查找可执行文件
-        if self.options.platform == "windows":
-            exe_name = f"{APP_NAME}.exe"
-            cache = self.build_dir / "CMakeCache.txt"
-            is_multi = False
-            if cache.exists():
-                try:
-                    _cache = cache.read_text(encoding="utf-8", errors="ignore")
-                    if "CMAKE_CONFIGURATION_TYPES" in _cache:
-                        is_multi = True
-                except Exception:
-                    pass
-            if is_multi:
-                app_path = self.build_dir / "app" / self.options.build_type / exe_name
-            else:
-                app_path = self.build_dir / "app" / exe_name
-        else:
-            app_path = self.build_dir / "app" / APP_NAME
+        exe_name = f"{APP_NAME}.exe" if self.options.platform == "windows" else APP_NAME
+        app_path = output_dir / exe_name
 
-        if not app_path.exists():
+        if app_path.name not in self._output_dir_names(output_dir):
             raise BuildError(f"Executable not found: {app_path}")
-        self.runner.run([str(app_path)], cwd=self.project_root, extra_env=self.options.env_overrides)
 
+        cmd = [str(app_path)]
+        # Linux 上用 exec 直接替换当前进程，构建脚本不再驻留等待 GUI 退出;
+        # Windows 的 exec 系列对 argv 引号处理有坑，仍走子进程方式
+        if allow_exec and not self.options.dry_run and self.options.platform != "windows":
+            # exec 会跳过 atexit，先等待后台删除线程完成
+            if self._clean_thread is not None:
+                self._clean_thread.join()
+            os.chdir(self.project_root)
+            if self.options.env_overrides:
+                os.execve(cmd[0], cmd, {**os.environ, **self.options.env_overrides})
+            else:
+                os.execv(cmd[0], cmd)
+        self.runner.run(cmd, cwd=self.project_root, extra_env=self.options.env_overrides)
 
-def parse_cli(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """构造命令行解析器(缓存，同进程多次调用 main 时只构建一次)"""
     parser = argparse.ArgumentParser(
         description="Serial Studio build orchestrator",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
@@ -621,6 +1165,7 @@ def parse_cli(argv: Optional[Sequence[str]]) -> argparse.Namespace:
     parser.add_argument("--build-dir", help="Output build directory.")
     parser.add_argument("--jobs", type=int, help="Maximum parallel build jobs.")
     parser.add_argument("--clean", action="store_true", help="Delete the build directory before configuring.")
+    parser.add_argument("--reconfigure", action="store_true", help="Force the CMake configure step even if the cache looks fresh.")
     parser.add_argument("--configure-only", action="store_true", help="Run configure step without building.")
     parser.add_argument("--run", dest="run_app", action="store_true", help="Launch the application after build.")
     parser.add_argument("--package", action="store_true", help="Invoke the CMake 'package' target after build.")
@@ -628,6 +1173,13 @@ def parse_cli(argv: Optional[Sequence[str]]) -> argparse.Namespace:
     parser.add_argument("--dry-run", action="store_true", help="Print commands without executing them.")
     parser.add_argument("--production", action="store_true", help="Enable production optimizations.")
     parser.add_argument("--sanitizer", action="store_true", help="Enable sanitizers (Debug builds).")
+    parser.add_argument(
+        "--no-compiler-cache",
+        dest="compiler_cache",
+        action="store_false",
+        default=True,
+        help="Do not wire ccache/sccache into the build even when available.",
+    )
     parser.add_argument("--commercial", action="store_true", help="Enable commercial build (disables GPL-only flag).")
     parser.add_argument("--verbose", action="store_true", help="Increase logging verbosity.")
     parser.add_argument("--qt-root", help="Path to the Qt installation used for this build.")
@@ -656,7 +1208,11 @@ def parse_cli(argv: Optional[Sequence[str]]) -> argparse.Namespace:
         help="Additional argument passed to the CMake configure step (can be repeated).",
     )
     parser.add_argument("remainder", nargs=argparse.REMAINDER, help="Additional arguments after '--' go to CMake.")
-    return parser.parse_args(argv)
+    return parser
+
+
+def parse_cli(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    return _build_parser().parse_args(argv)
 
 
 def merge_cli_with_config(cli: argparse.Namespace) -> BuildOptions:
@@ -699,8 +1255,10 @@ def merge_cli_with_config(cli: argparse.Namespace) -> BuildOptions:
         sanitizer=from_sources("sanitizer", cli.sanitizer),
         gpl_only=not from_sources("commercial", cli.commercial),
         clean=from_sources("clean", cli.clean),
+        reconfigure=from_sources("reconfigure", cli.reconfigure),
         run_after_build=from_sources("run_app", cli.run_app),
         create_package=from_sources("package", cli.package),
+        compiler_cache=from_sources("compiler_cache", cli.compiler_cache),
         info_only=from_sources("info", cli.info),
         verbose=from_sources("verbose", cli.verbose),
         qt_cmake_binary=from_sources("qt_cmake_binary"),
@@ -712,7 +1270,7 @@ def merge_cli_with_config(cli: argparse.Namespace) -> BuildOptions:
     )
 
     if options.jobs is None:
-        options.jobs = os.cpu_count() or 1
+        options.jobs = default_job_count()
 
     if options.build_type not in {"Release", "Debug"}:
         options.build_type = options.build_type.capitalize()
@@ -770,27 +1328,22 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
         logger = configure_logging(options.verbose)
         # 脚本位于 scripts/ 目录，项目根目录是其父目录
-        here = Path(__file__).resolve().parent
-        cwd = Path.cwd()
-        if (cwd / "CMakeLists.txt").exists():
-            project_root = cwd
-        elif (here / "CMakeLists.txt").exists():
-            project_root = here
-        elif (here.parent / "CMakeLists.txt").exists():
-            project_root = here.parent
-        else:
-            project_root = cwd
+        project_root = find_project_root(Path.cwd())
 
-        # 初始化命令执行器和工具链
-        runner = CommandRunner(logger=logger, dry_run=options.dry_run, env=dict(os.environ))
+        # 提前确定生成器:构建目录布局取决于它是否为多配置
         toolchain = select_toolchain(options)
-        builder = Builder(options=options, project_root=project_root, logger=logger, runner=runner, toolchain=toolchain)
+        if options.generator is None:
+            options.generator = toolchain.resolve_generator(options)
 
-        # 打印构建配置摘要
-        builder.info()
+        # 打印构建配置摘要(--info 到此为止，不构造构建器)
+        log_build_info(options, determine_build_directory(options, project_root), logger)
         if options.info_only:
             return 0
 
+        # 初始化命令执行器
+        runner = CommandRunner(logger=logger, dry_run=options.dry_run)
+        builder = Builder(options=options, project_root=project_root, logger=logger, runner=runner, toolchain=toolchain)
+
         # 可选:清理旧的构建目录
         if options.clean:
             builder.clean()
@@ -800,15 +1353,16 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         if options.configure_only:
             return 0
 
-        # 步骤 2:编译项目
-        builder.build()
-
-        # 可选:打包安装程序
-        if options.create_package:
-            builder.package()
+        # 步骤 2:编译项目;仅请求打包时把 package 目标并入同一次调用
+        builder.build(with_package=options.create_package and not options.run_after_build)
 
-        # 可选:启动应用程序
-        if options.run_after_build:
+        # 可选:打包 + 运行同时请求时互不依赖，后台打包的同时启动应用
+        if options.create_package and options.run_after_build:
+            package_proc = builder.package_async()
+            builder.run_app(allow_exec=package_proc is None)
+            if package_proc is not None and package_proc.wait() != 0:
+                raise BuildError(f"Packaging failed ({package_proc.returncode}).")
+        elif options.run_after_build:
             builder.run_app()
 
         logger.info("Build completed successfully.")
@@ -30,8 +30,14 @@ Windows 构建脚本 - 简化版
 import subprocess
 import sys
 import argparse
+import concurrent.futures
+import hashlib
+import json
+import os
+import re
+import shutil
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import Optional, List, Dict
 
 
@@ -54,12 +60,32 @@ class ToolchainConfig:
     build_type: str = "Release"           # 构建类型：Release 或 Debug
     build_dir: Path = field(default_factory=lambda: Path("build"))  # 构建目录
     jobs: Optional[int] = None            # 并行任务数（None = 自动检测）
+    keep_going: bool = False              # 失败后继续构建其余目标（ninja -k 0）
 
     # === 额外的 CMake 参数 ===
     extra_cmake_args: List[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        """一次性把所有工具路径规范化为绝对路径
+
+        后续各阶段直接使用解析结果，不再重复走符号链接/相对路径解析。
+        不用 strict 模式:模板配置在用户编辑前路径多半不存在，
+        存在性统一由 validate() 集中检查并一次性报全。
+        """
+        self.cmake_exe = Path(self.cmake_exe).resolve()
+        self.qt_prefix = Path(self.qt_prefix).resolve()
+        self.c_compiler = Path(self.c_compiler).resolve()
+        self.cxx_compiler = Path(self.cxx_compiler).resolve()
+        if self.make_program:
+            self.make_program = Path(self.make_program).resolve()
+        if self.qmake_exe:
+            self.qmake_exe = Path(self.qmake_exe).resolve()
+        self._validated = False
+
     def validate(self) -> None:
-        """验证所有路径是否存在"""
+        """验证所有路径是否存在(通过一次后不再重复 stat)"""
+        if self._validated:
+            return
         paths_to_check = {
             "CMake": self.cmake_exe,
             "Qt 安装目录": self.qt_prefix,
@@ -72,15 +98,116 @@ class ToolchainConfig:
         if self.qmake_exe:
             paths_to_check["qmake"] = self.qmake_exe
 
-        errors = []
-        for name, path in paths_to_check.items():
-            if not path.exists():
-                errors.append(f"  - {name}: {path}")
+        # 并发 stat:Windows 上每次 exists() 都要过 Defender 的 I/O
+        # 过滤器，六个路径并行探测把验证耗时压到最慢一次的水平
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(paths_to_check)) as pool:
+            exists_flags = list(pool.map(Path.exists, paths_to_check.values()))
+
+        errors = [
+            f"  - {name}: {path}"
+            for (name, path), found in zip(paths_to_check.items(), exists_flags)
+            if not found
+        ]
 
         if errors:
             raise FileNotFoundError(
                 "以下路径不存在，请检查配置：\n" + "\n".join(errors)
             )
+        self._validated = True
+
+
+# CMakeCache 中可跨构建树复用的工具链探测结果(try_compile 产物)
+_CHECK_ENTRY_RE = re.compile(r"^(HAVE_\w+|CMAKE_HAVE_\w+|__check_\w+):(\w+)=(.*)$")
+
+
+def default_job_count() -> int:
+    """自动检测并行任务数
+
+    优先用 sched_getaffinity(容器/CI 中反映真实 CPU 配额)，
+    Windows 等无此接口的平台退回 cpu_count。
+    """
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# Visual Studio Installer 自带的安装查询工具(位置固定)
+_VSWHERE = Path(r"C:\Program Files (x86)\Microsoft Visual Studio\Installer\vswhere.exe")
+
+
+def discover_msvc_compiler() -> Optional[Path]:
+    """用 vswhere 定位最新 Visual Studio 的 cl.exe(结果持久缓存)
+
+    配置里硬编码的 MSVC 版本号(如 14.40.33807)每次 VS 更新都会漂移;
+    当配置的 cl.exe 不存在时用本探测兜底，免去改脚本、反复配置失败的
+    循环。结果缓存到用户目录，以 VS Installer 目录的 mtime 判断失效
+    (安装/更新 VS 会改动该目录)。
+    """
+    cache_file = Path.home() / ".cache" / "build_windows" / "vs_location.json"
+    try:
+        installer_mtime = _VSWHERE.parent.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    # 命中持久缓存:一次 stat 验证 cl.exe 仍在即可，不再运行 vswhere
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        if cached.get("installer_mtime") == installer_mtime and Path(cached["cl_exe"]).exists():
+            return Path(cached["cl_exe"])
+    except (OSError, ValueError, KeyError):
+        pass
+
+    try:
+        result = subprocess.run(
+            [
+                str(_VSWHERE),
+                "-latest",
+                "-products", "*",
+                "-requires", "Microsoft.VisualStudio.Component.VC.Tools.x86.x64",
+                "-property", "installationPath",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    install_root = result.stdout.strip()
+    if not install_root:
+        return None
+
+    # 取版本号最高的工具集(按数值比较，避免 14.9 > 14.10 的字典序陷阱)
+    candidates = sorted(
+        Path(install_root).glob("VC/Tools/MSVC/*/bin/Hostx64/x64/cl.exe"),
+        key=lambda p: tuple(int(x) for x in p.parents[3].name.split(".") if x.isdigit()),
+    )
+    if not candidates:
+        return None
+    cl_exe = candidates[-1]
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(
+            json.dumps({"installer_mtime": installer_mtime, "cl_exe": str(cl_exe)}),
+            encoding="utf-8",
+        )
+    except OSError:
+        pass
+    return cl_exe
+
+
+def detect_compiler_cache(config_name: str) -> Optional[str]:
+    """探测可用的编译器缓存(sccache 优先)
+
+    MSVC 的 cl.exe 只有 sccache 支持;ccache 仅用于 MinGW。
+    命中缓存时未变更的翻译单元直接返回目标文件，跳过编译器调用。
+    """
+    sccache = shutil.which("sccache")
+    if sccache:
+        return sccache
+    if config_name == "msvc":
+        return None
+    return shutil.which("ccache")
 
 
 class WindowsBuilder:
@@ -88,41 +215,194 @@ class WindowsBuilder:
 
     def __init__(self, config: ToolchainConfig):
         self.config = config
+        # 最近一次构建的完整输出(失败时供 main 摘取关键错误行)
+        self.last_build_output = ""
+
+    def _subprocess_env(self) -> Dict[str, str]:
+        """CMake/Ninja 子进程环境:稳定开关走环境变量而非 -D 参数
+
+        环境变量不进入 CMakeCache，调整并行度或输出格式不会扰动缓存、
+        不触发重新配置;compile_commands.json 顺带产出供 clangd 使用。
+        """
+        env = os.environ.copy()
+        if self.config.jobs:
+            env["CMAKE_BUILD_PARALLEL_LEVEL"] = str(self.config.jobs)
+        env["CMAKE_EXPORT_COMPILE_COMMANDS"] = "1"
+        # 紧凑的进度行:已完成/总数 与 速率
+        env.setdefault("NINJA_STATUS", "[%f/%t %o/s] ")
+        return env
+
+    @property
+    def _fingerprint_file(self) -> Path:
+        return self.config.build_dir / ".build_fingerprint"
+
+    def _fingerprint(self) -> str:
+        """配置输入的指纹:工具链路径、生成器、构建类型、额外参数
+
+        jobs/keep_going 只影响构建阶段，不参与指纹，改它们不触发重新配置。
+        """
+        payload = {
+            k: v for k, v in asdict(self.config).items() if k not in ("jobs", "keep_going")
+        }
+        return hashlib.blake2b(
+            json.dumps(payload, sort_keys=True, default=str).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+
+    def _listfiles_up_to_date(self) -> bool:
+        """用 cmake-file-api 的 cmakeFiles 应答核对列表文件修改时间
+
+        应答列出本工程配置时实际读取的全部 CMakeLists.txt/*.cmake;
+        任何一个比 CMakeCache.txt 新都说明需要重新配置。尚无应答的
+        旧构建树跳过此检查(下次配置后即有)。
+        """
+        reply_dir = self.config.build_dir / ".cmake" / "api" / "v1" / "reply"
+        try:
+            reply = max(reply_dir.glob("cmakeFiles-v1-*.json"), key=lambda p: p.stat().st_mtime_ns)
+        except (ValueError, OSError):
+            return True
+        try:
+            data = json.loads(reply.read_text(encoding="utf-8"))
+            source_root = Path(data["paths"]["source"])
+            cache_mtime = (self.config.build_dir / "CMakeCache.txt").stat().st_mtime_ns
+            for item in data.get("inputs", []):
+                # 跳过 CMake 自带模块与配置期生成的文件
+                if item.get("isCMake") or item.get("isGenerated"):
+                    continue
+                path = Path(item["path"])
+                if not path.is_absolute():
+                    path = source_root / path
+                if path.stat().st_mtime_ns > cache_mtime:
+                    return False
+        except (OSError, KeyError, ValueError):
+            return False
+        return True
+
+    def _configure_up_to_date(self) -> bool:
+        """CMakeCache 存在、配置指纹未变且列表文件未更新时可跳过配置"""
+        if not (self.config.build_dir / "CMakeCache.txt").exists():
+            return False
+        try:
+            stored = self._fingerprint_file.read_text(encoding="utf-8").strip()
+        except OSError:
+            return False
+        return stored == self._fingerprint() and self._listfiles_up_to_date()
+
+    def _initial_cache_file(self) -> Path:
+        """共享的 CMake 初始缓存文件路径(按编译器路径+mtime 分键)
+
+        try_compile/feature 探测结果只取决于编译器，缓存在用户目录后
+        新建构建树(或换构建类型)的首次配置也能跳过这些探测。
+        不运行编译器取版本号:路径+mtime 变化足以识别编译器更新。
+        """
+        key_src = str(self.config.cxx_compiler)
+        try:
+            key_src += f":{self.config.cxx_compiler.stat().st_mtime_ns}"
+        except OSError:
+            pass
+        key = hashlib.blake2b(key_src.encode("utf-8"), digest_size=8).hexdigest()
+        return Path.home() / ".cache" / "build_windows" / f"initial_{key}.cmake"
+
+    def _write_initial_cache(self) -> None:
+        """从 CMakeCache.txt 提取工具链探测结果，固化为初始缓存文件"""
+        cmake_cache = self.config.build_dir / "CMakeCache.txt"
+        try:
+            lines = cmake_cache.read_text(encoding="utf-8", errors="replace").splitlines()
+        except OSError:
+            return
+        entries = []
+        for line in lines:
+            match = _CHECK_ENTRY_RE.match(line)
+            if match:
+                name, var_type, value = match.groups()
+                entries.append(f'set({name} "{value}" CACHE {var_type} "cached toolchain check")')
+        if not entries:
+            return
+        cache_file = self._initial_cache_file()
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text("\n".join(entries) + "\n", encoding="utf-8")
+        except OSError:
+            pass
+
+    @staticmethod
+    def _define_to_cache_line(define: str) -> str:
+        """把一条 -DNAME[:TYPE]=VALUE 转成初始缓存脚本里的 set() 行
+
+        FORCE 对齐 -D 的语义(覆盖已有缓存条目);反斜杠和引号按
+        CMake 字符串规则转义，含空格的路径(如 Program Files)不会被拆开。
+        """
+        name_type, _, value = define[2:].partition("=")
+        name, _, var_type = name_type.partition(":")
+        value = value.replace("\\", "\\\\").replace('"', '\\"')
+        return f'set({name} "{value}" CACHE {var_type or "STRING"} "spilled arg" FORCE)\n'
 
     def configure(self) -> None:
-        """配置阶段 - 生成构建文件"""
+        """配置阶段 - 生成构建文件(配置未变化时跳过)"""
+        if self._configure_up_to_date():
+            print("[配置] CMake 缓存已是最新，跳过配置")
+            return
+        # 预置 file-api 查询，让本次配置顺带产出 cmakeFiles 应答
+        query_dir = self.config.build_dir / ".cmake" / "api" / "v1" / "query"
+        query_dir.mkdir(parents=True, exist_ok=True)
+        (query_dir / "cmakeFiles-v1").touch(exist_ok=True)
+
         print(f"[配置] 使用生成器: {self.config.generator}")
         print(f"[配置] 构建类型: {self.config.build_type}")
         print(f"[配置] Qt 路径: {self.config.qt_prefix}")
         print(f"[配置] C++ 编译器: {self.config.cxx_compiler}")
 
-        # 基础 CMake 参数
+        # 一次列表字面量构造完整命令，可选项用条件解包拼入
         args = [
             str(self.config.cmake_exe),
             "-S", ".",  # 源码目录
             "-B", str(self.config.build_dir),  # 构建目录
             "-G", self.config.generator,
+            # 复用以往固化的 try_compile 探测结果
+            *(
+                ["-C", str(initial_cache)]
+                if (initial_cache := self._initial_cache_file()).exists()
+                else []
+            ),
             f"-DCMAKE_BUILD_TYPE={self.config.build_type}",
+            # Qt 相关路径
+            f"-DCMAKE_PREFIX_PATH:PATH={self.config.qt_prefix}",
+            *(
+                [f"-DQT_QMAKE_EXECUTABLE:FILEPATH={self.config.qmake_exe}"]
+                if self.config.qmake_exe
+                else []
+            ),
+            # 编译器路径
+            f"-DCMAKE_C_COMPILER:FILEPATH={self.config.c_compiler}",
+            f"-DCMAKE_CXX_COMPILER:FILEPATH={self.config.cxx_compiler}",
+            # 构建工具路径
+            *(
+                [f"-DCMAKE_MAKE_PROGRAM:FILEPATH={self.config.make_program}"]
+                if self.config.make_program
+                else []
+            ),
+            # 额外参数
+            *self.config.extra_cmake_args,
         ]
 
-        # Qt 相关路径
-        args.append(f"-DCMAKE_PREFIX_PATH:PATH={self.config.qt_prefix}")
-        if self.config.qmake_exe:
-            args.append(f"-DQT_QMAKE_EXECUTABLE:FILEPATH={self.config.qmake_exe}")
-
-        # 编译器路径
-        args.append(f"-DCMAKE_C_COMPILER:FILEPATH={self.config.c_compiler}")
-        args.append(f"-DCMAKE_CXX_COMPILER:FILEPATH={self.config.cxx_compiler}")
-
-        # 构建工具路径
-        if self.config.make_program:
-            args.append(f"-DCMAKE_MAKE_PROGRAM:FILEPATH={self.config.make_program}")
-
-        # 额外参数
-        args.extend(self.config.extra_cmake_args)
+        # Windows 的 CreateProcess 命令行上限约 32K 字符;参数堆多时
+        # (launcher/unity/vcpkg 等都会追加 -D)把 -D 定义转存为 -C 初始
+        # 缓存脚本。cmake 不支持 @file 响应文件，-C 是它认可的等价物
+        if sum(len(str(a)) + 1 for a in args) > 8192:
+            defines = [a for a in args if a.startswith("-D")]
+            args = [a for a in args if not a.startswith("-D")]
+            self.config.build_dir.mkdir(parents=True, exist_ok=True)
+            spill_path = self.config.build_dir / "cmake_args_cache.cmake"
+            spill_path.write_text(
+                "".join(self._define_to_cache_line(d) for d in defines),
+                encoding="utf-8",
+            )
+            args.extend(["-C", str(spill_path)])
 
         print(f"\n[执行] {' '.join(str(a) for a in args)}\n")
-        subprocess.run(args, check=True)
+        subprocess.run(args, check=True, env=self._subprocess_env())
+        self._fingerprint_file.write_text(self._fingerprint() + "\n", encoding="utf-8")
+        self._write_initial_cache()
         print("[配置] 完成")
 
     def build(self) -> None:
@@ -139,8 +419,33 @@ class WindowsBuilder:
         if self.config.jobs:
             args.extend(["-j", str(self.config.jobs)])
 
+        # 失败后继续:一次构建暴露所有互不依赖的编译错误，省掉重试轮次
+        if self.config.keep_going:
+            args.extend(["--", "-k", "0"])
+
         print(f"[执行] {' '.join(str(a) for a in args)}\n")
-        subprocess.run(args, check=True)
+        # 逐行转发并留存输出:每行及时刷新，非 TTY(CI)下日志不再整段
+        # 积压到构建结束。不设 CREATE_NEW_PROCESS_GROUP:脱离控制台
+        # 进程组的子进程收不到 Ctrl-C，保持同组才能随脚本一起中断
+        proc = subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            env=self._subprocess_env(),
+        )
+        lines: List[str] = []
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            print(line, end="", flush=True)
+            lines.append(line)
+        returncode = proc.wait()
+        self.last_build_output = "".join(lines)
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, args)
         print("\n[构建] 完成")
 
     def run(self) -> None:
@@ -154,21 +459,28 @@ class WindowsBuilder:
 # 配置模板 - 根据你的实际路径修改
 # ============================================================================
 
+# 两份配置共用的 msys2 工具路径(只构造一次 Path 对象)
+_MSYS2_CMAKE = Path(r"D:\Develop\msys2\usr\bin\cmake.exe")
+_MSYS2_NINJA = Path(r"D:\Develop\msys2\usr\bin\ninja.exe")
+
+# MSVC 的 cl.exe 同时充当 C/C++ 编译器，单处定义保证两者不会漂移
+# （需要在 Visual Studio 安装目录中找到 cl.exe，按实际安装位置修改）
+_MSVC_CL = Path(r"C:\Program Files\Microsoft Visual Studio\2022\Community\VC\Tools\MSVC\14.40.33807\bin\Hostx64\x64\cl.exe")
+
 # MSVC 工具链配置示例
 MSVC_CONFIG = ToolchainConfig(
     # CMake（使用 msys2 中的）
-    cmake_exe=Path(r"D:\Develop\msys2\usr\bin\cmake.exe"),
+    cmake_exe=_MSYS2_CMAKE,
 
     # Qt 安装目录（MSVC 版本）
     qt_prefix=Path(r"D:\Develop\Qt\6.9.3\msvc2022_64"),
 
-    # MSVC 编译器路径（需要在 Visual Studio 安装目录中找到 cl.exe）
-    # 示例路径，你需要根据实际 Visual Studio 安装位置修改
-    c_compiler=Path(r"C:\Program Files\Microsoft Visual Studio\2022\Community\VC\Tools\MSVC\14.40.33807\bin\Hostx64\x64\cl.exe"),
-    cxx_compiler=Path(r"C:\Program Files\Microsoft Visual Studio\2022\Community\VC\Tools\MSVC\14.40.33807\bin\Hostx64\x64\cl.exe"),
+    # MSVC 编译器路径
+    c_compiler=_MSVC_CL,
+    cxx_compiler=_MSVC_CL,
 
     # 构建工具（使用 msys2 中的 ninja）
-    make_program=Path(r"D:\Develop\msys2\usr\bin\ninja.exe"),
+    make_program=_MSYS2_NINJA,
 
     # qmake 路径（可选）
     qmake_exe=Path(r"D:\Develop\Qt\6.9.3\msvc2022_64\bin\qmake.exe"),
@@ -187,7 +499,7 @@ MSVC_CONFIG = ToolchainConfig(
 # MinGW 工具链配置示例
 MINGW_CONFIG = ToolchainConfig(
     # CMake（使用 msys2 中的）
-    cmake_exe=Path(r"D:\Develop\msys2\usr\bin\cmake.exe"),
+    cmake_exe=_MSYS2_CMAKE,
 
     # Qt 安装目录（MinGW 版本）
     qt_prefix=Path(r"D:\Develop\Qt\6.9.3\mingw_64"),
@@ -196,16 +508,14 @@ MINGW_CONFIG = ToolchainConfig(
     c_compiler=Path(r"D:\Develop\msys2\mingw64\bin\gcc.exe"),
     cxx_compiler=Path(r"D:\Develop\msys2\mingw64\bin\g++.exe"),
 
-    # 构建工具（可以用 ninja 或 mingw32-make）
-    make_program=Path(r"D:\Develop\msys2\usr\bin\ninja.exe"),
-    # make_program=Path(r"D:\Develop\msys2\mingw64\bin\mingw32-make.exe"),  # 或者用这个
+    # 构建工具（仅支持 ninja）
+    make_program=_MSYS2_NINJA,
 
     # qmake 路径（可选）
     qmake_exe=Path(r"D:\Develop\Qt\6.9.3\mingw_64\bin\qmake.exe"),
 
     # 生成器
     generator="Ninja",
-    # generator="MinGW Makefiles",  # 如果用 mingw32-make
 
     # 额外参数（可选）
     extra_cmake_args=[
@@ -235,6 +545,7 @@ def main():
 
 注意：
   所有工具路径在脚本中硬编码，请先编辑 MSVC_CONFIG 或 MINGW_CONFIG
+  本脚本仅支持 Ninja 生成器（make_program 必须指向 ninja.exe）
         """
     )
 
@@ -265,6 +576,32 @@ def main():
         help="构建目录（默认：build）"
     )
 
+    parser.add_argument(
+        "--keep-going", "-k",
+        action="store_true",
+        help="编译失败后继续构建其余目标，一次性暴露所有错误"
+    )
+
+    parser.add_argument(
+        "--incremental-only",
+        action="store_true",
+        help="跳过 CMake 配置，直接在已有构建目录运行 ninja"
+    )
+
+    parser.add_argument(
+        "--unity",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="启用 CMake Unity Build（默认：Release 开启，Debug 关闭）"
+    )
+
+    parser.add_argument(
+        "--no-compiler-cache",
+        dest="compiler_cache",
+        action="store_false",
+        help="禁用 sccache/ccache 编译器缓存"
+    )
+
     args = parser.parse_args()
 
     # 选择配置
@@ -273,11 +610,74 @@ def main():
     else:
         config = MINGW_CONFIG
 
+    # 硬编码的 cl.exe 路径失效时(VS 更新后版本号漂移)用 vswhere 重新定位
+    if args.config == "msvc" and not config.c_compiler.exists():
+        discovered = discover_msvc_compiler()
+        if discovered:
+            print(f"[配置] 通过 vswhere 定位 cl.exe: {discovered}")
+            config.c_compiler = discovered
+            config.cxx_compiler = discovered
+
+    # 只支持 Ninja:DAG 调度与自动并行明显优于 Make 系生成器，
+    # 统一生成器也让指纹缓存与增量路径保持简单
+    if config.generator != "Ninja":
+        print(f"✗ 配置错误：仅支持 Ninja 生成器（当前：{config.generator}）", file=sys.stderr)
+        sys.exit(1)
+    if not config.make_program:
+        print("✗ 配置错误：Ninja 生成器需要设置 make_program 指向 ninja.exe", file=sys.stderr)
+        sys.exit(1)
+
+    # 快速增量路径:构建文件已生成时直接运行 ninja，跳过配置指纹、
+    # 路径验证等所有前置逻辑，日常"改一个文件重编"走这条最短路径
+    if args.incremental_only:
+        ninja_file = args.build_dir / "build.ninja"
+        if not ninja_file.exists():
+            print(f"✗ --incremental-only 需要已配置的构建目录（未找到 {ninja_file}）", file=sys.stderr)
+            sys.exit(1)
+        jobs = args.jobs or default_job_count()
+        result = subprocess.run(
+            [str(config.make_program), "-C", str(args.build_dir), "-j", str(jobs)]
+        )
+        sys.exit(result.returncode)
+
     # 覆盖命令行参数
     config.build_type = args.build_type
-    if args.jobs:
-        config.jobs = args.jobs
+    # 显式传递并行度，不依赖构建工具自行猜测
+    config.jobs = args.jobs or default_job_count()
     config.build_dir = args.build_dir
+    config.keep_going = args.keep_going
+
+    # Unity Build:合并翻译单元，大幅减少编译器进程数与头文件重复解析
+    # Release 默认开启;Debug 默认关闭，保持最小的增量重编译范围
+    unity = args.unity if args.unity is not None else (args.build_type == "Release")
+    if unity:
+        config.extra_cmake_args.extend([
+            "-DCMAKE_UNITY_BUILD=ON",
+            "-DCMAKE_UNITY_BUILD_BATCH_SIZE=16",
+            "-DCMAKE_PCH_INSTANTIATE_TEMPLATES=ON",
+        ])
+
+    # 自动接入编译器缓存，重复构建时未变更的文件直接命中缓存
+    if args.compiler_cache:
+        launcher = detect_compiler_cache(args.config)
+        if launcher:
+            launcher_posix = Path(launcher).as_posix()
+            print(f"[配置] 编译器缓存: {launcher_posix}")
+            config.extra_cmake_args.extend([
+                f"-DCMAKE_C_COMPILER_LAUNCHER={launcher_posix}",
+                f"-DCMAKE_CXX_COMPILER_LAUNCHER={launcher_posix}",
+            ])
+            # 提前拉起 sccache 服务(不等待):启动耗时完全隐藏在
+            # 随后的 CMake 配置阶段里，首个编译任务即可直接命中
+            if "sccache" in Path(launcher).name:
+                try:
+                    subprocess.Popen(
+                        [launcher, "--start-server"],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                    )
+                except OSError:
+                    pass
 
     # 执行构建
     try:
@@ -286,6 +686,16 @@ def main():
         print("\n✓ 构建成功！")
     except subprocess.CalledProcessError as e:
         print(f"\n✗ 构建失败，退出码：{e.returncode}", file=sys.stderr)
+        # 从留存的构建输出中摘出失败目标与错误行，免去回翻滚动日志
+        failed_lines = [
+            line
+            for line in builder.last_build_output.splitlines()
+            if "FAILED:" in line or "error" in line.lower()
+        ]
+        if failed_lines:
+            print("\n失败摘要：", file=sys.stderr)
+            for line in failed_lines:
+                print(f"  {line}", file=sys.stderr)
         sys.exit(1)
     except FileNotFoundError as e:
         print(f"\n✗ 配置错误：{e}", file=sys.stderr)